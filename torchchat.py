@@ -5,8 +5,8 @@
 # LICENSE file in the root directory of this source tree.
 
 import argparse
+import importlib
 import logging
-import subprocess
 import sys
 
 # MPS ops missing with Multimodal torchtune
@@ -20,13 +20,42 @@ from torchchat.cli.cli import (
     check_args,
     INVENTORY_VERBS,
     KNOWN_VERBS,
+    shared_parsers_for_verb,
 )
 
 default_device = "cpu"
 
-
-if __name__ == "__main__":
-    # Initialize the top-level parser
+VERB_HELP = {
+    "chat": "Chat interactively with a model via the CLI",
+    "generate": "Generate responses from a model given a prompt",
+    "browser": "Chat interactively with a model in a locally hosted browser",
+    "export": "Export a model artifact to AOT Inductor or ExecuTorch",
+    "download": "Download model artifacts",
+    "list": "List all supported models",
+    "remove": "Remove downloaded model artifacts",
+    "where": "Return directory containing downloaded model artifacts",
+    "server": "[WIP] Starts a locally hosted REST server for model interaction",
+    "eval": "Evaluate a model via lm-eval",
+}
+
+# Dispatch table for subcommands:
+#   verb -> (module, entry point, whether to run check_args, args overrides)
+# Modules are imported lazily so each subcommand only pays for its own imports.
+COMMANDS = {
+    "chat": ("torchchat.generate", "main", True, {"chat": True}),
+    "generate": ("torchchat.generate", "main", True, {}),
+    "server": ("torchchat.usages.server", "main", True, {}),
+    "eval": ("torchchat.usages.eval", "main", False, {}),
+    "export": ("torchchat.export", "main", True, {}),
+    "download": ("torchchat.cli.download", "download_main", True, {}),
+    "list": ("torchchat.cli.download", "list_main", True, {}),
+    "where": ("torchchat.cli.download", "where_main", True, {}),
+    "remove": ("torchchat.cli.download", "remove_main", True, {}),
+}
+
+
+# Build the top-level parser for the given command line arguments.
+def _build_parser(argv) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="torchchat",
         add_help=True,
@@ -38,21 +67,25 @@ if __name__ == "__main__":
     )
     subparsers.required = True
 
-    VERB_HELP = {
-        "chat": "Chat interactively with a model via the CLI",
-        "generate": "Generate responses from a model given a prompt",
-        "browser": "Chat interactively with a model in a locally hosted browser",
-        "export": "Export a model artifact to AOT Inductor or ExecuTorch",
-        "download": "Download model artifacts",
-        "list": "List all supported models",
-        "remove": "Remove downloaded model artifacts",
-        "where": "Return directory containing downloaded model artifacts",
-        "server": "[WIP] Starts a locally hosted REST server for model interaction",
-        "eval": "Evaluate a model via lm-eval",
-    }
-    for verb, description in VERB_HELP.items():
-        subparser = subparsers.add_parser(verb, help=description)
-        add_arguments_for_verb(subparser, verb)
+    # Only build the subparser for the requested verb; fall back to building
+    # all of them for --help, a missing verb, or an unknown verb.
+    requested_verb = argv[0] if argv else None
+    if requested_verb in VERB_HELP:
+        verbs_to_build = [requested_verb]
+    else:
+        verbs_to_build = list(VERB_HELP)
+
+    for verb in verbs_to_build:
+        subparser = subparsers.add_parser(
+            verb, help=VERB_HELP[verb], parents=shared_parsers_for_verb(verb)
+        )
+        add_arguments_for_verb(subparser, verb, include_shared_args=False)
+
+    return parser
+
+
+if __name__ == "__main__":
+    parser = _build_parser(sys.argv[1:])
 
     # Now parse the arguments
     args = parser.parse_args()
@@ -65,55 +98,15 @@ if __name__ == "__main__":
         format="%(message)s", level=logging.DEBUG if args.verbose else logging.INFO
     )
 
-    if args.command == "chat":
-        # enable "chat"
-        args.chat = True
-        check_args(args, "chat")
-        from generate import main as generate_main
-
-        generate_main(args)
-    elif args.command == "browser":
+    if args.command == "browser":
         print(
             "\nTo test out the browser please use: streamlit run torchchat/usages/browser.py <args>\n"
         )
-    elif args.command == "server":
-        check_args(args, "server")
-        from torchchat.usages.server import main as server_main
-
-        server_main(args)
-    elif args.command == "generate":
-        check_args(args, "generate")
-        from torchchat.generate import main as generate_main
-
-        generate_main(args)
-    elif args.command == "eval":
-        from torchchat.usages.eval import main as eval_main
-
-        eval_main(args)
-    elif args.command == "export":
-        check_args(args, "export")
-        from torchchat.export import main as export_main
-
-        export_main(args)
-    elif args.command == "download":
-        check_args(args, "download")
-        from torchchat.cli.download import download_main
-
-        download_main(args)
-    elif args.command == "list":
-        check_args(args, "list")
-        from torchchat.cli.download import list_main
-
-        list_main(args)
-    elif args.command == "where":
-        check_args(args, "where")
-        from torchchat.cli.download import where_main
-
-        where_main(args)
-    elif args.command == "remove":
-        check_args(args, "remove")
-        from torchchat.cli.download import remove_main
-
-        remove_main(args)
+    elif args.command in COMMANDS:
+        module_name, entry_point, needs_check, overrides = COMMANDS[args.command]
+        vars(args).update(overrides)
+        if needs_check:
+            check_args(args, args.command)
+        getattr(importlib.import_module(module_name), entry_point)(args)
     else:
         parser.print_help()
@@ -5,21 +5,17 @@
 # LICENSE file in the root directory of this source tree.
 
 import argparse
-import json
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import List
 
-import torch
-
-from torchchat.cli.download import download_and_convert, is_model_downloaded
-
-from torchchat.utils.build_utils import (
-    allowable_dtype_names,
-    allowable_params_table,
-    get_device_str,
-)
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -42,8 +38,14 @@ KNOWN_VERBS = GENERATION_VERBS + ["eval", "export"] + INVENTORY_VERBS
 
 # Handle CLI arguments that are common to a majority of subcommands.
 def check_args(args, verb: str) -> None:
+    from torchchat.cli.download import download_and_convert, is_model_downloaded
+
     # Handle model download. Skip this for download, since it has slightly
     # different semantics.
+    # Explicit --checkpoint-path/--gguf-path are mutually exclusive with
+    # `model`, so they never reach the download check. --dso-path/--pte-path
+    # do not skip it: exported models still load the checkpoint, params and
+    # tokenizer from the downloaded model directory.
     if (
         verb not in INVENTORY_VERBS
         and getattr(args, "model", None)
@@ -54,11 +56,16 @@ def check_args(args, verb: str) -> None:
 
 # Given a arg parser and a subcommand (verb), add the appropriate arguments
 # for that subcommand.
-def add_arguments_for_verb(parser, verb: str) -> None:
+# Pass include_shared_args=False when the parser was created with
+# parents=shared_parsers_for_verb(verb), which already carry those arguments.
+def add_arguments_for_verb(
+    parser, verb: str, include_shared_args: bool = True
+) -> None:
     # Argument closure for inventory related subcommands
     if verb in INVENTORY_VERBS:
         _configure_artifact_inventory_args(parser, verb)
-        _add_cli_metadata_args(parser)
+        if include_shared_args:
+            _add_cli_metadata_args(parser)
         return
 
     # Add argument groups for model specification (what base model to use)
@@ -81,12 +88,53 @@ def add_arguments_for_verb(parser, verb: str) -> None:
     # Add CLI Args related to downloading of model artifacts (if not already downloaded)
     _add_jit_downloading_args(parser)
 
-    # Add CLI Args that are general to subcommand cli execution
-    _add_cli_metadata_args(parser)
+    if include_shared_args:
+        # Add CLI Args that are general to subcommand cli execution
+        _add_cli_metadata_args(parser)
+
+        # WIP Features (suppressed from --help)
+        _add_distributed_args(parser)
+        _add_speculative_execution_args(parser)
+
+
+# Given a subcommand (verb), return the cached parent parsers holding the
+# arguments that are identical across subcommands, so that building several
+# subparsers shares a single set of argparse Actions for them.
+def shared_parsers_for_verb(verb: str) -> List[argparse.ArgumentParser]:
+    if verb in INVENTORY_VERBS:
+        return [_cli_metadata_parent()]
+    return [_cli_metadata_parent(), _wip_features_parent()]
+
+
+@lru_cache(maxsize=1)
+def _cli_metadata_parent() -> argparse.ArgumentParser:
+    parent = argparse.ArgumentParser(add_help=False)
+    _add_cli_metadata_args(parent)
+    return parent
+
 
-    # WIP Features (suppressed from --help)
-    _add_distributed_args(parser)
-    _add_speculative_execution_args(parser)
+@lru_cache(maxsize=1)
+def _wip_features_parent() -> argparse.ArgumentParser:
+    parent = argparse.ArgumentParser(add_help=False)
+    _add_distributed_args(parent)
+    _add_speculative_execution_args(parent)
+    return parent
+
+
+# Choices for --dtype and --params-table, computed once per process since
+# every non-inventory subparser uses them
+@lru_cache(maxsize=1)
+def _dtype_choices() -> List[str]:
+    from torchchat.utils.build_utils import allowable_dtype_names
+
+    return list(allowable_dtype_names())
+
+
+@lru_cache(maxsize=1)
+def _params_table_choices() -> List[str]:
+    from torchchat.utils.build_utils import allowable_params_table
+
+    return allowable_params_table()
 
 
 # Add CLI Args related to model specification (what base model to use)
@@ -108,7 +156,7 @@ def _add_model_specification_args(parser) -> None:
     exclusive_parser.add_argument(
         "--checkpoint-path",
         type=Path,
-        default="not_specified",
+        default=None,
         help="Use the specified model checkpoint path",
     )
 
@@ -151,7 +199,7 @@ def _add_model_config_args(parser, verb: str) -> None:
     model_config_parser.add_argument(
         "--dtype",
         default="fast",
-        choices=allowable_dtype_names(),
+        choices=_dtype_choices(),
         help="Override the dtype of the model (default is the checkpoint dtype). Options: bf16, fp16, fp32, fast16, fast",
     )
     model_config_parser.add_argument(
@@ -417,7 +465,7 @@ def _add_custom_model_args(parser) -> None:
         "--params-table",
         type=str,
         default=None,
-        choices=allowable_params_table(),
+        choices=_params_table_choices(),
         help=argparse.SUPPRESS,
         # "Parameter table to use",
     )
@@ -466,6 +514,10 @@ def _add_speculative_execution_args(parser) -> None:
 
 
 def arg_init(args):
+    import torch
+
+    from torchchat.utils.build_utils import get_device_str
+
     if not (torch.__version__ > "2.3"):
         raise RuntimeError(
             f"You are using PyTorch {torch.__version__}. At this time, torchchat uses the latest PyTorch technology with high-performance kernels only available in PyTorch nightly until the PyTorch 2.4 release"
@@ -474,12 +526,17 @@ def arg_init(args):
     if sys.version_info.major != 3 or sys.version_info.minor < 10:
         raise RuntimeError("Please use Python 3.10 or later.")
 
-    if hasattr(args, "quantize") and Path(args.quantize).is_file():
-        with open(args.quantize, "r") as f:
-            args.quantize = json.loads(f.read())
+    # Inline JSON is the common case; only stat the filesystem otherwise
+    if (
+        hasattr(args, "quantize")
+        and not args.quantize.lstrip().startswith("{")
+        and Path(args.quantize).is_file()
+    ):
+        with open(args.quantize, "rb") as f:
+            args.quantize = _json.loads(f.read())
 
     if isinstance(args.quantize, str):
-        args.quantize = json.loads(args.quantize)
+        args.quantize = _json.loads(args.quantize)
 
     # if we specify dtype in quantization recipe, replicate it as args.dtype
     args.dtype = args.quantize.get("precision", {}).get("dtype", args.dtype)
@@ -501,6 +558,6 @@ def arg_init(args):
             vars(args)["compile"] = False
             vars(args)["compile_prefill"] = False
 
-    if hasattr(args, "seed") and args.seed:
+    if getattr(args, "seed", None):
         torch.manual_seed(args.seed)
     return args
@@ -10,7 +10,6 @@ import urllib.request
 from pathlib import Path
 from typing import Optional
 
-from torchchat.cli.convert_hf_checkpoint import convert_hf_checkpoint, convert_hf_checkpoint_to_tune
 from torchchat.model_config.model_config import (
     load_model_configs,
     ModelConfig,
@@ -25,6 +24,11 @@ def _download_hf_snapshot(
     from huggingface_hub import model_info, snapshot_download
     from requests.exceptions import HTTPError
 
+    from torchchat.cli.convert_hf_checkpoint import (
+        convert_hf_checkpoint,
+        convert_hf_checkpoint_to_tune,
+    )
+
     # Download and store the HF model artifacts.
     print(f"Downloading {model_config.name} from HuggingFace...", file=sys.stderr)
     try: